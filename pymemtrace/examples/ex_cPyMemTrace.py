@@ -1,8 +1,5 @@
 import sys
 
-import psutil
-
-from pymemtrace import custom
 from pymemtrace import cPyMemTrace
 
 
@@ -42,18 +39,31 @@ def test_well_over_512():
 
 def f(l):
     print('Hi')
-    s = ' ' * l
+    s = bytearray(l)
     print('Bye')
 
 
+#: Lazily created psutil.Process, reused so that sampling does not create a new Process each time.
+_PROCESS = None
+
+
+def _memory_info():
+    global _PROCESS
+    if _PROCESS is None:
+        import psutil
+
+        _PROCESS = psutil.Process()
+    return _PROCESS.memory_info()
+
+
 def g():
-    print(f'Creating Custom.')
-    # pid = psutil.Process()
-    # print(f'Creating Custom: {pid.memory_info()}')
+    # Only needed by this function so import lazily.
+    from pymemtrace import custom
+
+    print(f'Creating Custom: {_memory_info()}')
     obj = custom.Custom('First', 'Last')
     print(obj.name())
-    # print(f'Done: {pid.memory_info()}')
-    print(f'Done.')
+    print(f'Done: {_memory_info()}')
 
 
 def example_for_documentation():